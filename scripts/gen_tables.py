@@ -0,0 +1,113 @@
+"""Generate the precomputed Unicode tables in ``word_count._unitables``.
+
+The Asian character class is defined here in terms of Unicode scripts and
+blocks. Resolving ``\\p{Script=...}`` / ``\\p{Block=...}`` properties is only
+done when this script runs; the result is baked into the package as
+coalesced codepoint ranges so the runtime patterns can be compiled by the
+standard library ``re`` module, which has no Unicode property support.
+
+The whitespace classes are baked too: ``re``'s ``\\s`` also matches
+U+001C..U+001F, which the ``regex`` definition (Unicode White_Space) does not.
+
+Requires the ``regex`` library (a dev dependency).
+
+Usage:
+    python scripts/gen_tables.py
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import regex
+
+OUTPUT = Path(__file__).resolve().parent.parent / "src" / "word_count" / "_unitables.py"
+
+# Unicode script patterns for Asian character detection
+# Includes: Chinese, Japanese (Hiragana/Katakana), Korean, and related symbols
+ASIAN_PROPERTIES = "".join(
+    (
+        # Scripts
+        r"\p{Script=Han}",  # Chinese characters (also used in Japanese Kanji)
+        r"\p{Script=Hiragana}",  # Japanese Hiragana
+        r"\p{Script=Katakana}",  # Japanese Katakana
+        r"\p{Script=Hangul}",  # Korean characters
+        r"\p{Script=Bopomofo}",  # Chinese phonetic symbols
+        # Blocks - Common
+        r"\p{Block=Halfwidth_and_Fullwidth_Forms}",  # Full-width punctuation/letters
+        r"\p{Block=CJK_Symbols_and_Punctuation}",  # CJK punctuation
+        # Note: Enclosed_Alphanumerics (①②③) excluded — Word counts them as 1 word
+        r"\p{Block=Enclosed_CJK_Letters_and_Months}",  # ㈱ ㈲ ㊀ ㊁
+        r"\p{Block=CJK_Compatibility}",  # ㍻ ㍼ ㍽ (era names, units)
+        r"\p{Block=CJK_Compatibility_Forms}",  # Vertical punctuation
+        r"\p{Block=Vertical_Forms}",  # Vertical writing symbols
+        # Blocks - Radicals and extended
+        r"\p{Block=Kangxi_Radicals}",  # Kangxi radicals
+        r"\p{Block=CJK_Radicals_Supplement}",  # Radical supplements
+        r"\p{Block=Ideographic_Symbols_and_Punctuation}",  # 〽 etc.
+        r"\p{Block=Katakana_Phonetic_Extensions}",  # ㇰㇱㇲ Ainu katakana
+        # Script=Common but functionally CJK (not matched by Script=Katakana)
+        r"・ー",  # U+30FB Middle Dot, U+30FC Prolonged Sound Mark
+    )
+)
+
+
+def coalesce(pattern: str) -> list[tuple[int, int]]:
+    """Enumerate every codepoint matching ``pattern`` as inclusive ranges.
+
+    Args:
+        pattern: A single-character regex pattern (typically a class).
+
+    Returns:
+        Sorted list of (first, last) codepoint pairs.
+    """
+    compiled = regex.compile(pattern)
+    ranges: list[tuple[int, int]] = []
+    for cp in range(0x110000):
+        if not compiled.match(chr(cp)):
+            continue
+        if ranges and ranges[-1][1] == cp - 1:
+            ranges[-1] = (ranges[-1][0], cp)
+        else:
+            ranges.append((cp, cp))
+    return ranges
+
+
+def render_ranges(name: str, comment: str, ranges: list[tuple[int, int]]) -> str:
+    """Render a range table as a Python constant definition."""
+    lines = [f"# {comment}", f"{name}: Final[tuple[tuple[int, int], ...]] = ("]
+    lines.extend(f"    (0x{lo:04X}, 0x{hi:04X})," for lo, hi in ranges)
+    lines.append(")")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Write the generated tables module."""
+    tables = [
+        render_ranges(
+            "ASIAN_RANGES",
+            "Codepoints counted as one word each (CJK scripts and blocks)",
+            coalesce(rf"[{ASIAN_PROPERTIES}]"),
+        ),
+        render_ranges(
+            "SPACE_RANGES",
+            "Codepoints removed from the no-space character count (Zs + ASCII spaces)",
+            coalesce(r"[\p{Zs}\t\n\r\f\v]"),
+        ),
+        render_ranges(
+            "WHITESPACE_RANGES",
+            "Codepoints that separate non-Asian words (Unicode White_Space)",
+            coalesce(r"\s"),
+        ),
+    ]
+    header = (
+        '"""Precomputed Unicode tables.\n\n'
+        "Generated by scripts/gen_tables.py. Do not edit by hand.\n"
+        '"""\n\n'
+        "from typing import Final\n"
+    )
+    OUTPUT.write_text(header + "\n" + "\n\n".join(tables) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,8 +8,11 @@ is counted by whitespace-separated words.
 
 from word_count.counter import (
     calculate_word_statistics,
+    calculate_word_statistics_streaming,
+    count_asian_characters,
     count_characters,
     count_characters_with_space,
+    count_non_asian_words,
     count_words,
 )
 from word_count.statistics import Statistics
@@ -19,7 +22,10 @@ __all__ = [
     "Statistics",
     "__version__",
     "calculate_word_statistics",
+    "calculate_word_statistics_streaming",
+    "count_asian_characters",
     "count_characters",
     "count_characters_with_space",
+    "count_non_asian_words",
     "count_words",
 ]
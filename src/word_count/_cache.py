@@ -0,0 +1,205 @@
+"""Persistent per-file statistics cache for the CLI.
+
+Results are stored in a SQLite database keyed by absolute path,
+modification and status-change times and size, so an unchanged file is
+answered with a single ``stat()`` instead of being read and scanned again.
+Only regular files are cached. Entries are never evicted: the database
+grows by one row per distinct path and is safe to delete at any time. The
+cache is strictly best-effort: any error opening or using the database
+disables it for the rest of the run rather than failing the command.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import sqlite3
+import stat
+import sys
+import time
+from pathlib import Path
+from types import TracebackType
+
+from word_count import __version__
+from word_count.statistics import Statistics
+
+# Files modified this recently are not stored: a further write within the
+# same mtime tick would leave the cached entry looking current
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Bump when the table layout changes; older databases are then rebuilt
+_SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE statistics (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    ctime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    version TEXT NOT NULL,
+    words INTEGER NOT NULL,
+    characters_no_space INTEGER NOT NULL,
+    characters_with_space INTEGER NOT NULL,
+    non_asian_words INTEGER NOT NULL,
+    asian_characters INTEGER NOT NULL
+)
+"""
+
+
+def default_cache_dir() -> Path:
+    """Return the platform's per-user cache directory for this tool.
+
+    Returns:
+        ``office-wordcount`` under ``%LOCALAPPDATA%`` on Windows, otherwise
+        under ``$XDG_CACHE_HOME`` when set, falling back to
+        ``~/Library/Caches`` on macOS and ``~/.cache`` elsewhere.
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or str(Path.home() / "AppData" / "Local")
+    elif os.environ.get("XDG_CACHE_HOME"):
+        base = os.environ["XDG_CACHE_HOME"]
+    elif sys.platform == "darwin":
+        base = str(Path.home() / "Library" / "Caches")
+    else:
+        base = str(Path.home() / ".cache")
+    return Path(base) / "office-wordcount"
+
+
+class StatisticsCache:
+    """Best-effort persistent cache of per-file Statistics.
+
+    Call ``get`` before reading a file and ``put`` after analyzing it; the
+    entry is keyed by the ``stat()`` taken in ``get``, so a file modified
+    while it was being read is not cached under its new timestamp.
+    Writes are committed in one transaction by ``close``.
+
+    Example:
+        >>> with StatisticsCache() as cache:
+        ...     stats = cache.get(path)
+        ...     if stats is None:
+        ...         stats = calculate_word_statistics(read_file(path))
+        ...         cache.put(path, stats)
+    """
+
+    def __init__(self, directory: Path | None = None) -> None:
+        """Open (creating if needed) the cache database.
+
+        Args:
+            directory: Directory holding the database. Defaults to
+                       ``default_cache_dir()``.
+        """
+        self._pending: dict[str, tuple[int, int, int]] = {}
+        self._conn: sqlite3.Connection | None = None
+        try:
+            directory = directory or default_cache_dir()
+            directory.mkdir(parents=True, exist_ok=True)
+            # SQLite's own file locking serializes concurrent invocations
+            self._conn = sqlite3.connect(directory / "statistics.sqlite3", timeout=5.0)
+            (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+            if version != _SCHEMA_VERSION:
+                # Cached results are cheap to recompute, so no migration
+                with self._conn:
+                    self._conn.execute("DROP TABLE IF EXISTS statistics")
+                    self._conn.execute(_SCHEMA)
+                    self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        except (OSError, sqlite3.Error):
+            self._disable()
+
+    def get(self, path: Path) -> Statistics | None:
+        """Look up cached statistics for a file.
+
+        Args:
+            path: File to look up.
+
+        Returns:
+            The cached Statistics if the file is a regular file unchanged
+            since it was stored, otherwise None.
+        """
+        if self._conn is None:
+            return None
+        key = str(path.absolute())
+        try:
+            info = path.stat()
+        except OSError:
+            return None
+        # Pipes and devices (e.g. /dev/stdin) have to be read every time
+        if not stat.S_ISREG(info.st_mode):
+            return None
+        self._pending[key] = (info.st_mtime_ns, info.st_ctime_ns, info.st_size)
+
+        try:
+            row = self._conn.execute(
+                "SELECT words, characters_no_space, characters_with_space,"
+                " non_asian_words, asian_characters FROM statistics"
+                " WHERE path = ? AND mtime_ns = ? AND ctime_ns = ? AND size = ?"
+                " AND version = ?",
+                (key, info.st_mtime_ns, info.st_ctime_ns, info.st_size, __version__),
+            ).fetchone()
+        except sqlite3.Error:
+            self._disable()
+            return None
+        if row is None:
+            return None
+        return Statistics(*row)
+
+    def put(self, path: Path, stats: Statistics) -> None:
+        """Store statistics for a file previously passed to ``get``.
+
+        Args:
+            path: File the statistics were calculated for.
+            stats: Statistics to store.
+        """
+        key = str(path.absolute())
+        stamp = self._pending.pop(key, None)
+        if self._conn is None or stamp is None:
+            return
+        mtime_ns, ctime_ns, size = stamp
+        # A later write always moves mtime to the present, so only a recent
+        # mtime is ambiguous; ctime (chmod, touch -r) is covered by the key
+        if time.time_ns() - mtime_ns < _RACY_WINDOW_NS:
+            return
+
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO statistics"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    mtime_ns,
+                    ctime_ns,
+                    size,
+                    __version__,
+                    stats.words,
+                    stats.characters_no_space,
+                    stats.characters_with_space,
+                    stats.non_asian_words,
+                    stats.asian_characters,
+                ),
+            )
+        except sqlite3.Error:
+            self._disable()
+
+    def close(self) -> None:
+        """Commit pending writes and close the database."""
+        if self._conn is None:
+            return
+        with contextlib.suppress(sqlite3.Error):
+            self._conn.commit()
+        self._disable()
+
+    def _disable(self) -> None:
+        """Stop using the database for the rest of this run."""
+        if self._conn is not None:
+            self._conn.close()
+        self._conn = None
+
+    def __enter__(self) -> StatisticsCache:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -6,15 +6,55 @@ reading from files or stdin, with JSON or table output.
 
 from __future__ import annotations
 
-import argparse
+import codecs
+import contextlib
+import os
 import sys
-from collections.abc import Sequence
+from collections.abc import Callable, Iterator, Sequence
 from pathlib import Path
-
-from word_count import __version__, calculate_word_statistics
-from word_count.formatter import format_json, format_table, is_interactive
+from typing import TYPE_CHECKING, cast
+
+from word_count import (
+    __version__,
+    calculate_word_statistics,
+    calculate_word_statistics_streaming,
+    count_asian_characters,
+    count_characters,
+    count_characters_with_space,
+    count_non_asian_words,
+    count_words,
+)
 from word_count.statistics import Statistics
 
+if TYPE_CHECKING:
+    import argparse
+
+    from word_count._cache import StatisticsCache
+
+# Files larger than this are analyzed chunk by chunk to bound memory use
+CHUNK_SIZE = 1 << 20
+
+# Counter computing only the named Statistics field, for single-value output
+_FIELD_COUNTERS: dict[str, Callable[[str], int]] = {
+    "words": count_words,
+    "characters_no_space": count_characters,
+    "characters_with_space": count_characters_with_space,
+    "non_asian_words": count_non_asian_words,
+    "asian_characters": count_asian_characters,
+}
+
+# Option values when no options are given, matching create_parser()'s defaults
+_DEFAULT_OPTIONS: dict[str, object] = {
+    "format": "auto",
+    "total": False,
+    "cache": True,
+    "words": False,
+    "chars": False,
+    "chars_with_space": False,
+    "asian": False,
+    "non_asian": False,
+}
+
 
 def create_parser() -> argparse.ArgumentParser:
     """Create and configure the argument parser.
@@ -22,6 +62,8 @@ def create_parser() -> argparse.ArgumentParser:
     Returns:
         Configured ArgumentParser instance.
     """
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="office-wordcount",
         description="Count words in text files, handling mixed Asian and non-Asian text.",
@@ -61,6 +103,16 @@ def create_parser() -> argparse.ArgumentParser:
         help="Show only the total (for multiple files).",
     )
 
+    parser.add_argument(
+        "--cache",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help=(
+            "Reuse results for unchanged files from a per-user cache. "
+            "(default: enabled)"
+        ),
+    )
+
     # Single value options (mutually exclusive)
     value_group = parser.add_mutually_exclusive_group()
     value_group.add_argument(
@@ -113,9 +165,26 @@ def read_stdin() -> str:
     return sys.stdin.read()
 
 
+def _advise_sequential(fd: int) -> None:
+    """Hint that a file will be read once, front to back.
+
+    The kernel then reads ahead more aggressively. Pages are deliberately
+    not dropped afterwards: repeated runs over the same files benefit from
+    them staying cached.
+    """
+    if hasattr(os, "posix_fadvise"):
+        # Not supported on pipes and some filesystems; it's only a hint
+        with contextlib.suppress(OSError):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
 def read_file(path: Path) -> str:
     """Read text content from a file.
 
+    Files larger than ``CHUNK_SIZE`` are handed to ``iter_file_chunks``
+    instead, so this only sees small files, for which a single
+    ``read_bytes()`` beats memory-mapping.
+
     Args:
         path: Path to the file to read.
 
@@ -127,58 +196,133 @@ def read_file(path: Path) -> str:
         PermissionError: If the file cannot be read.
         UnicodeDecodeError: If the file is not valid UTF-8.
     """
-    return path.read_text(encoding="utf-8")
+    return path.read_bytes().decode("utf-8")
+
+
+def iter_file_chunks(path: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Yield the text content of a file in chunks.
+
+    The file is read in binary blocks and each block is decoded in one
+    call, with an incremental decoder carrying any UTF-8 sequence split
+    across two blocks. This avoids the many small decode steps of a
+    text-mode reader.
+
+    Args:
+        path: Path to the file to read.
+        chunk_size: Number of bytes to read per chunk.
+
+    Yields:
+        Consecutive pieces of the file contents.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        PermissionError: If the file cannot be read.
+        UnicodeDecodeError: If the file is not valid UTF-8.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    with path.open("rb", buffering=0) as f:
+        _advise_sequential(f.fileno())
+        for block in iter(lambda: f.read(chunk_size), b""):
+            if text := decoder.decode(block):
+                yield text
+    # Raises if the file ends inside a multi-byte sequence
+    if text := decoder.decode(b"", final=True):
+        yield text
+
+
+def _process_file(path: Path) -> Statistics:
+    """Read a single file and calculate its statistics."""
+    if path.stat().st_size > CHUNK_SIZE:
+        return calculate_word_statistics_streaming(iter_file_chunks(path))
+    return calculate_word_statistics(read_file(path))
+
+
+def _count_file_field(path: Path, field: str) -> int:
+    """Read a single file and calculate only one of its statistics."""
+    if path.stat().st_size > CHUNK_SIZE:
+        stats = calculate_word_statistics_streaming(iter_file_chunks(path))
+        value: int = getattr(stats, field)
+        return value
+    return _FIELD_COUNTERS[field](read_file(path))
 
 
 def process_files(
     paths: Sequence[Path],
+    cache: StatisticsCache | None = None,
 ) -> tuple[list[tuple[str, Statistics]], Statistics]:
     """Process multiple files and calculate statistics.
 
+    Results keep the order of ``paths``.
+
     Args:
         paths: Sequence of file paths to process.
+        cache: Optional cache consulted before reading each file and
+               updated with the statistics of files that were read.
 
     Returns:
         Tuple of (list of (filename, stats) pairs, total stats).
     """
     results: list[tuple[str, Statistics]] = []
-    total = Statistics(
-        words=0,
-        characters_no_space=0,
-        characters_with_space=0,
-        non_asian_words=0,
-        asian_characters=0,
-    )
-
     for path in paths:
-        text = read_file(path)
-        stats = calculate_word_statistics(text)
+        stats = cache.get(path) if cache is not None else None
+        if stats is None:
+            stats = _process_file(path)
+            if cache is not None:
+                cache.put(path, stats)
         results.append((str(path), stats))
-        total = total + stats
 
+    total = Statistics.total(stats for _, stats in results)
     return results, total
 
 
-def get_single_value(stats: Statistics, args: argparse.Namespace) -> int | None:
-    """Extract a single value from stats based on args.
+def total_single_value(
+    paths: Sequence[Path],
+    field: str,
+    cache: StatisticsCache | None = None,
+) -> int:
+    """Calculate one statistic summed over multiple files.
+
+    Unlike ``process_files``, files missing from the cache are scanned only
+    for the requested statistic. Those partial results are not stored.
+
+    Args:
+        paths: Sequence of file paths to process.
+        field: Name of the Statistics field to calculate.
+        cache: Optional cache consulted before reading each file.
+
+    Returns:
+        Sum of the requested statistic over all files.
+    """
+    total = 0
+    for path in paths:
+        stats = cache.get(path) if cache is not None else None
+        if stats is None:
+            total += _count_file_field(path, field)
+        else:
+            total += getattr(stats, field)
+    return total
+
+
+def get_single_value_field(args: argparse.Namespace) -> str | None:
+    """Return the Statistics field selected by a single-value option.
 
     Args:
-        stats: Statistics object.
         args: Parsed arguments.
 
     Returns:
-        The requested value, or None if no single-value option was specified.
+        The requested field name, or None if no single-value option was
+        specified.
     """
     if args.words:
-        return stats.words
+        return "words"
     if args.chars:
-        return stats.characters_no_space
+        return "characters_no_space"
     if args.chars_with_space:
-        return stats.characters_with_space
+        return "characters_with_space"
     if args.non_asian:
-        return stats.non_asian_words
+        return "non_asian_words"
     if args.asian:
-        return stats.asian_characters
+        return "asian_characters"
     return None
 
 
@@ -189,10 +333,25 @@ def _render_output(
     total: Statistics | None = None,
 ) -> None:
     """Render statistics to stdout in the specified format."""
+    # Deferred so single-value runs don't pay for importing the JSON backends
+    from word_count.formatter import is_interactive, write_json, write_table
+
+    if output_format == "auto":
+        output_format = "table" if is_interactive() else "json"
     if output_format == "json":
-        print(format_json(stats, total=total))
+        write_json(stats, sys.stdout, total=total)
     else:
-        print(format_table(stats, total=total))
+        write_table(stats, sys.stdout, total=total)
+    # Flush here so a closed pipe is reported inside run()'s error handling
+    sys.stdout.flush()
+
+
+def _open_cache() -> StatisticsCache:
+    """Open the per-user statistics cache."""
+    # Deferred so stdin and --no-cache runs don't pay for importing sqlite3
+    from word_count._cache import StatisticsCache
+
+    return StatisticsCache()
 
 
 def run(args: argparse.Namespace) -> int:
@@ -204,34 +363,33 @@ def run(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors).
     """
-    output_format = args.format
-    if output_format == "auto":
-        output_format = "table" if is_interactive() else "json"
-
     try:
-        # 1. Normalize input
+        # 1. Gather statistics; with a single-value option, only that one,
+        # summed over all inputs
+        field = get_single_value_field(args)
         if args.files:
             paths = [Path(f) for f in args.files]
-            results, total = process_files(paths)
+            with _open_cache() if args.cache else contextlib.nullcontext() as cache:
+                if field is not None:
+                    value = total_single_value(paths, field, cache)
+                else:
+                    results, total = process_files(paths, cache)
+        elif field is not None:
+            value = _FIELD_COUNTERS[field](read_stdin())
         else:
-            text = read_stdin()
-            stats = calculate_word_statistics(text)
+            stats = calculate_word_statistics(read_stdin())
             results, total = [("stdin", stats)], stats
 
-        # 2. Determine target stats
-        target_stats = total if (args.total or len(results) > 1) else results[0][1]
-
-        # 3. Single value output (early return)
-        single_value = get_single_value(target_stats, args)
-        if single_value is not None:
-            print(single_value)
+        # 2. Single value output (early return)
+        if field is not None:
+            print(value)
             return 0
 
-        # 4. Structured output
+        # 3. Structured output
         if args.total or len(results) == 1:
-            _render_output(output_format, target_stats)
+            _render_output(args.format, total)
         else:
-            _render_output(output_format, results, total=total)
+            _render_output(args.format, results, total=total)
 
     except FileNotFoundError as e:
         print(f"Error: File not found: {e.filename}", file=sys.stderr)
@@ -257,8 +415,16 @@ def run(args: argparse.Namespace) -> int:
 
 def main() -> None:
     """Entry point for the CLI."""
-    parser = create_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+    if any(arg.startswith("-") for arg in argv):
+        args = create_parser().parse_args(argv)
+    else:
+        # Only file names (or nothing): skip importing argparse and building
+        # the parser. run() only reads attributes, so a SimpleNamespace will do.
+        from types import SimpleNamespace
+
+        options = SimpleNamespace(files=argv, **_DEFAULT_OPTIONS)
+        args = cast("argparse.Namespace", options)
     sys.exit(run(args))
 
 
@@ -8,12 +8,42 @@ from __future__ import annotations
 import json
 import sys
 from collections.abc import Sequence
-from typing import TYPE_CHECKING
+from itertools import chain
+from typing import TYPE_CHECKING, Any, TextIO
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
 
 if TYPE_CHECKING:
     from word_count.statistics import Statistics
 
 
+def _dumps(obj: Any, indent: int | None) -> str:
+    """Serialize to JSON, using orjson when it is installed.
+
+    orjson only supports two-space indentation and valid UTF-8 strings
+    (filenames that aren't decodable contain lone surrogates), and it
+    cannot escape non-ASCII characters. It also writes DEL (U+007F) raw,
+    where the standard library escapes it. Its output is only used when it
+    is ASCII without DEL, so both backends give identical output that any
+    stdout encoding can write; other cases fall back to the standard
+    library.
+    """
+    if orjson is not None and indent in (2, None):
+        option = orjson.OPT_INDENT_2 if indent else 0
+        try:
+            data = orjson.dumps(obj, option=option)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            if data.isascii() and b"\x7f" not in data:
+                return data.decode()
+    separators = (",", ": ") if indent is not None else (",", ":")
+    return json.dumps(obj, indent=indent, separators=separators)
+
+
 def format_json(
     stats: Statistics | Sequence[tuple[str, Statistics]],
     *,
@@ -37,8 +67,51 @@ def format_json(
         }
         if total is not None:
             result["total"] = total.to_dict()
-        return json.dumps(result, indent=indent)
-    return json.dumps(stats.to_dict(), indent=indent)
+        return _dumps(result, indent)
+    return _dumps(stats.to_dict(), indent)
+
+
+def write_json(
+    stats: Statistics | Sequence[tuple[str, Statistics]],
+    stream: TextIO,
+    *,
+    total: Statistics | None = None,
+    indent: int | None = 2,
+) -> None:
+    """Write statistics as JSON, followed by a newline.
+
+    Writes the same document as ``format_json``, but serializes and writes
+    each file's entry separately, so neither the whole document nor a dict
+    of every file's statistics is built in memory.
+
+    Args:
+        stats: Either a single Statistics object or a sequence of
+               (filename, Statistics) tuples.
+        stream: Text stream to write to (e.g. ``sys.stdout``).
+        total: Optional total Statistics for multiple files.
+        indent: JSON indentation level. None for compact output.
+    """
+    if not isinstance(stats, Sequence):
+        stream.write(_dumps(stats.to_dict(), indent) + "\n")
+        return
+
+    if indent is None:
+        newline, pad, colon = "", "", ":"
+    else:
+        newline, pad, colon = "\n", " " * indent, ": "
+
+    def nested(obj: dict[str, Any], depth: int) -> str:
+        # JSON strings escape newlines, so every newline here is layout
+        return _dumps(obj, indent).replace("\n", "\n" + pad * depth)
+
+    stream.write(f'{{{newline}{pad}"files"{colon}[')
+    for i, (name, stat) in enumerate(stats):
+        entry = nested({"file": name, **stat.to_dict()}, 2)
+        stream.write(f"{',' if i else ''}{newline}{pad * 2}{entry}")
+    stream.write(f"{newline}{pad}]" if stats else "]")
+    if total is not None:
+        stream.write(f',{newline}{pad}"total"{colon}{nested(total.to_dict(), 1)}')
+    stream.write(f"{newline}}}\n")
 
 
 def format_table(
@@ -56,12 +129,38 @@ def format_table(
     Returns:
         ASCII table formatted string.
     """
+    return "\n".join(_table_lines(stats, total=total))
+
+
+def write_table(
+    stats: Statistics | Sequence[tuple[str, Statistics]],
+    stream: TextIO,
+    *,
+    total: Statistics | None = None,
+) -> None:
+    """Write statistics as an ASCII table, followed by a newline.
+
+    Args:
+        stats: Either a single Statistics object or a sequence of
+               (filename, Statistics) tuples.
+        stream: Text stream to write to (e.g. ``sys.stdout``).
+        total: Optional total Statistics for multiple files.
+    """
+    stream.writelines(f"{line}\n" for line in _table_lines(stats, total=total))
+
+
+def _table_lines(
+    stats: Statistics | Sequence[tuple[str, Statistics]],
+    *,
+    total: Statistics | None = None,
+) -> list[str]:
+    """Build the lines of the table for either input shape."""
     if isinstance(stats, Sequence):
-        return _format_multiple_table(stats, total=total)
-    return _format_single_table(stats)
+        return _multiple_table_lines(stats, total=total)
+    return _single_table_lines(stats)
 
 
-def _format_single_table(stats: Statistics) -> str:
+def _single_table_lines(stats: Statistics) -> list[str]:
     """Format a single Statistics object as a vertical table."""
     labels = [
         ("Words", stats.words),
@@ -72,20 +171,23 @@ def _format_single_table(stats: Statistics) -> str:
     ]
 
     max_label = max(len(label) for label, _ in labels)
-    lines = [f"{label.ljust(max_label)} : {value}" for label, value in labels]
-    return "\n".join(lines)
+    return [f"{label.ljust(max_label)} : {value}" for label, value in labels]
 
 
-def _format_multiple_table(
+def _multiple_table_lines(
     files: Sequence[tuple[str, Statistics]],
     *,
     total: Statistics | None = None,
-) -> str:
+) -> list[str]:
     """Format multiple file statistics as a horizontal table."""
     headers = ["File", "Words", "Chars", "Chars+Space", "Non-Asian", "Asian"]
+    entries = chain(files, [("TOTAL", total)] if total is not None else [])
 
-    rows = [
-        [
+    # Build rows and column widths in the same pass
+    widths = [len(h) for h in headers]
+    rows: list[list[str]] = []
+    for name, s in entries:
+        row = [
             name,
             str(s.words),
             str(s.characters_no_space),
@@ -93,34 +195,15 @@ def _format_multiple_table(
             str(s.non_asian_words),
             str(s.asian_characters),
         ]
-        for name, s in files
-    ]
-
-    if total is not None:
-        rows.append(
-            [
-                "TOTAL",
-                str(total.words),
-                str(total.characters_no_space),
-                str(total.characters_with_space),
-                str(total.non_asian_words),
-                str(total.asian_characters),
-            ]
-        )
-
-    # Calculate column widths
-    widths = [
-        max(len(headers[i]), max(len(row[i]) for row in rows))
-        for i in range(len(headers))
-    ]
-
-    # Build table
-    lines: list[str] = []
+        for i, cell in enumerate(row):
+            widths[i] = max(widths[i], len(cell))
+        rows.append(row)
 
     # Header
-    header_line = " | ".join(h.ljust(w) for h, w in zip(headers, widths, strict=True))
-    lines.append(header_line)
-    lines.append("-+-".join("-" * w for w in widths))
+    lines = [
+        " | ".join(h.ljust(w) for h, w in zip(headers, widths, strict=True)),
+        "-+-".join("-" * w for w in widths),
+    ]
 
     # Data rows
     for row in rows:
@@ -128,7 +211,7 @@ def _format_multiple_table(
             " | ".join(cell.ljust(w) for cell, w in zip(row, widths, strict=True))
         )
 
-    return "\n".join(lines)
+    return lines
 
 
 def is_interactive() -> bool:
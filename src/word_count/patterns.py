@@ -1,62 +1,57 @@
 """Pre-compiled regex patterns for text analysis.
 
 All patterns are compiled at module load time for optimal performance.
-Uses the 'regex' library for Unicode property support (\\p{...}).
+Unicode script/block membership is precomputed into codepoint ranges by
+scripts/gen_tables.py, so the patterns only need the standard library
+``re`` module and no property lookups happen at runtime.
 """
 
+import re
+from collections.abc import Iterable
 from typing import Final
 
-import regex
+from word_count._unitables import ASIAN_RANGES, SPACE_RANGES, WHITESPACE_RANGES
 
-# Matches any whitespace characters including Unicode spaces
-SPACES: Final[regex.Pattern[str]] = regex.compile(r"[\p{Zs}\t\n\r\f\v]+")
 
-# Matches line break characters (CR, LF, or CRLF)
-BREAKS: Final[regex.Pattern[str]] = regex.compile(r"[\r\n]+")
+def _char_class(ranges: Iterable[tuple[int, int]]) -> str:
+    """Render codepoint ranges as the body of a regex character class."""
+    return "".join(f"\\U{lo:08X}-\\U{hi:08X}" for lo, hi in ranges)
 
-# Unicode script patterns for Asian character detection
-# Includes: Chinese, Japanese (Hiragana/Katakana), Korean, and related symbols
-ASIAN_PATTERN: Final[str] = "".join(
-    (
-        # Scripts
-        r"\p{Script=Han}",  # Chinese characters (also used in Japanese Kanji)
-        r"\p{Script=Hiragana}",  # Japanese Hiragana
-        r"\p{Script=Katakana}",  # Japanese Katakana
-        r"\p{Script=Hangul}",  # Korean characters
-        r"\p{Script=Bopomofo}",  # Chinese phonetic symbols
-        # Blocks - Common
-        r"\p{Block=Halfwidth_and_Fullwidth_Forms}",  # Full-width punctuation/letters
-        r"\p{Block=CJK_Symbols_and_Punctuation}",  # CJK punctuation
-        # Note: Enclosed_Alphanumerics (①②③) excluded — Word counts them as 1 word
-        r"\p{Block=Enclosed_CJK_Letters_and_Months}",  # ㈱ ㈲ ㊀ ㊁
-        r"\p{Block=CJK_Compatibility}",  # ㍻ ㍼ ㍽ (era names, units)
-        r"\p{Block=CJK_Compatibility_Forms}",  # Vertical punctuation
-        r"\p{Block=Vertical_Forms}",  # Vertical writing symbols
-        # Blocks - Radicals and extended
-        r"\p{Block=Kangxi_Radicals}",  # Kangxi radicals
-        r"\p{Block=CJK_Radicals_Supplement}",  # Radical supplements
-        r"\p{Block=Ideographic_Symbols_and_Punctuation}",  # 〽 etc.
-        r"\p{Block=Katakana_Phonetic_Extensions}",  # ㇰㇱㇲ Ainu katakana
-        # Script=Common but functionally CJK (not matched by Script=Katakana)
-        r"・ー",  # U+30FB Middle Dot, U+30FC Prolonged Sound Mark
-    )
+
+# Whitespace characters including Unicode spaces (\p{Zs}\t\n\r\f\v)
+# Plain strings: counting each character with str.count beats a regex pass
+SPACE_CHARS: Final[str] = "".join(
+    chr(cp) for lo, hi in SPACE_RANGES for cp in range(lo, hi + 1)
 )
 
+# Line break characters (CR, LF)
+BREAK_CHARS: Final[str] = "\r\n"
+
+# Asian character class, expanded from Unicode scripts and blocks at build time
+# Includes: Chinese, Japanese (Hiragana/Katakana), Korean, and related symbols
+# See scripts/gen_tables.py for the property-level definition.
+ASIAN_PATTERN: Final[str] = _char_class(ASIAN_RANGES)
+
+# Unicode White_Space, used instead of re's \s (which also matches U+001C..U+001F)
+WHITESPACE_PATTERN: Final[str] = _char_class(WHITESPACE_RANGES)
+
 # Characters excluded from character counts (invisible/presentation modifiers)
 # - U+FEFF: BOM (Byte Order Mark)
 # - U+200B: ZWSP (Zero Width Space)
 # - U+FE00-FE0F: Variation Selectors (VS1-16)
 # - U+E0100-E01EF: Variation Selectors Supplement (VS17-256)
 # Note: ZWJ (U+200D) and ZWNJ (U+200C) are NOT excluded — Word counts them
-CHAR_EXCLUDES: Final[regex.Pattern[str]] = regex.compile(
+CHAR_EXCLUDES: Final[re.Pattern[str]] = re.compile(
     r"[\uFEFF\u200B\uFE00-\uFE0F\U000E0100-\U000E01EF]+"
 )
 
 # Unicode line/paragraph separators — Word counts each as 1 word
-UNICODE_SEPARATORS: Final[regex.Pattern[str]] = regex.compile(r"[\u2028\u2029]")
+UNICODE_SEPARATORS: Final[str] = "\u2028\u2029"
 
 # Matches one or more consecutive Asian characters
-ASIANS: Final[regex.Pattern[str]] = regex.compile(rf"[{ASIAN_PATTERN}]+")
+ASIANS: Final[re.Pattern[str]] = re.compile(f"[{ASIAN_PATTERN}]+")
 
 # Matches one or more consecutive non-Asian, non-whitespace characters (Western words)
-NON_ASIAN_WORDS: Final[regex.Pattern[str]] = regex.compile(rf"[^{ASIAN_PATTERN}\s]+")
+NON_ASIAN_WORDS: Final[re.Pattern[str]] = re.compile(
+    f"[^{ASIAN_PATTERN}{WHITESPACE_PATTERN}]+"
+)
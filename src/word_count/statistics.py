@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from collections.abc import Iterable
+from dataclasses import dataclass
 
 
 @dataclass(frozen=True, slots=True)
@@ -44,7 +45,15 @@ class Statistics:
         Returns:
             Dictionary with all statistics fields and their values.
         """
-        return asdict(self)
+        # Written out rather than dataclasses.asdict(), which deep-copies
+        # every field through generic introspection
+        return {
+            "words": self.words,
+            "characters_no_space": self.characters_no_space,
+            "characters_with_space": self.characters_with_space,
+            "non_asian_words": self.non_asian_words,
+            "asian_characters": self.asian_characters,
+        }
 
     def __add__(self, other: Statistics) -> Statistics:
         """Add two Statistics objects together.
@@ -57,12 +66,38 @@ class Statistics:
         Returns:
             New Statistics object with summed values.
         """
+        # Positional arguments: keyword passing is measurably slower here
         return Statistics(
-            words=self.words + other.words,
-            characters_no_space=self.characters_no_space + other.characters_no_space,
-            characters_with_space=(
-                self.characters_with_space + other.characters_with_space
-            ),
-            non_asian_words=self.non_asian_words + other.non_asian_words,
-            asian_characters=self.asian_characters + other.asian_characters,
+            self.words + other.words,
+            self.characters_no_space + other.characters_no_space,
+            self.characters_with_space + other.characters_with_space,
+            self.non_asian_words + other.non_asian_words,
+            self.asian_characters + other.asian_characters,
         )
+
+    @classmethod
+    def total(cls, items: Iterable[Statistics]) -> Statistics:
+        """Sum any number of Statistics objects.
+
+        Equivalent to chaining ``+``, but the counts are accumulated as plain
+        ints and only one object is built, where ``+`` builds (and freezes)
+        a new one per addition.
+
+        Args:
+            items: Statistics objects to add up.
+
+        Returns:
+            Statistics with summed values (all zero if ``items`` is empty).
+
+        Example:
+            >>> Statistics.total([stats_a, stats_b]) == stats_a + stats_b
+            True
+        """
+        words = no_space = with_space = non_asian_words = asian_characters = 0
+        for stats in items:
+            words += stats.words
+            no_space += stats.characters_no_space
+            with_space += stats.characters_with_space
+            non_asian_words += stats.non_asian_words
+            asian_characters += stats.asian_characters
+        return cls(words, no_space, with_space, non_asian_words, asian_characters)
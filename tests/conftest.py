@@ -0,0 +1,10 @@
+"""Shared pytest configuration."""
+
+import os
+import sys
+
+# Don't write bytecode, neither from this process (for modules imported from
+# here on) nor from interpreters started by the tests, which inherit the
+# environment variable
+sys.dont_write_bytecode = True
+os.environ.setdefault("PYTHONDONTWRITEBYTECODE", "1")
@@ -0,0 +1,115 @@
+"""Tests for the persistent statistics cache."""
+
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from word_count._cache import StatisticsCache, default_cache_dir
+from word_count.statistics import Statistics
+
+STATS = Statistics(
+    words=2,
+    characters_no_space=10,
+    characters_with_space=11,
+    non_asian_words=2,
+    asian_characters=0,
+)
+
+
+@pytest.fixture
+def old_file(tmp_path: Path) -> Path:
+    """Create a file whose mtime is well outside the racy window."""
+    file = tmp_path / "old.txt"
+    file.write_text("Hello World", encoding="utf-8")
+    an_hour_ago = time.time() - 3600
+    os.utime(file, (an_hour_ago, an_hour_ago))
+    return file
+
+
+def _store(directory: Path, path: Path, stats: Statistics) -> None:
+    """Store stats for path in a cache under directory."""
+    with StatisticsCache(directory) as cache:
+        assert cache.get(path) is None
+        cache.put(path, stats)
+
+
+class TestStatisticsCache:
+    """Tests for StatisticsCache."""
+
+    def test_round_trip(self, tmp_path: Path, old_file: Path) -> None:
+        """Test that stored statistics are returned for an unchanged file."""
+        _store(tmp_path / "cache", old_file, STATS)
+        with StatisticsCache(tmp_path / "cache") as cache:
+            assert cache.get(old_file) == STATS
+
+    def test_modified_file_misses(self, tmp_path: Path, old_file: Path) -> None:
+        """Test that changing the file invalidates its entry."""
+        _store(tmp_path / "cache", old_file, STATS)
+        old_file.write_text("Hello World again", encoding="utf-8")
+        with StatisticsCache(tmp_path / "cache") as cache:
+            assert cache.get(old_file) is None
+
+    def test_recent_file_not_stored(self, tmp_path: Path) -> None:
+        """Test that files modified within the racy window are not cached."""
+        fresh = tmp_path / "fresh.txt"
+        fresh.write_text("Hello World", encoding="utf-8")
+        _store(tmp_path / "cache", fresh, STATS)
+        with StatisticsCache(tmp_path / "cache") as cache:
+            assert cache.get(fresh) is None
+
+    def test_permission_change_misses(self, tmp_path: Path, old_file: Path) -> None:
+        """Test that chmod (which only changes ctime) invalidates the entry."""
+        _store(tmp_path / "cache", old_file, STATS)
+        old_file.chmod(0o600)
+        with StatisticsCache(tmp_path / "cache") as cache:
+            assert cache.get(old_file) is None
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs named pipes")
+    def test_fifo_not_cached(self, tmp_path: Path) -> None:
+        """Test that non-regular files are never looked up or stored."""
+        fifo = tmp_path / "pipe"
+        os.mkfifo(fifo)
+        an_hour_ago = time.time() - 3600
+        os.utime(fifo, (an_hour_ago, an_hour_ago))
+        _store(tmp_path / "cache", fifo, STATS)
+        with sqlite3.connect(tmp_path / "cache" / "statistics.sqlite3") as conn:
+            assert conn.execute("SELECT COUNT(*) FROM statistics").fetchone() == (0,)
+
+    def test_old_schema_rebuilt(self, tmp_path: Path, old_file: Path) -> None:
+        """Test that a database from an older layout is replaced, not disabled."""
+        directory = tmp_path / "cache"
+        directory.mkdir()
+        with sqlite3.connect(directory / "statistics.sqlite3") as conn:
+            conn.execute("CREATE TABLE statistics (path TEXT PRIMARY KEY)")
+        _store(directory, old_file, STATS)
+        with StatisticsCache(directory) as cache:
+            assert cache.get(old_file) == STATS
+
+    def test_put_without_get_ignored(self, tmp_path: Path, old_file: Path) -> None:
+        """Test that put only stores files looked up with get first."""
+        with StatisticsCache(tmp_path / "cache") as cache:
+            cache.put(old_file, STATS)
+        with StatisticsCache(tmp_path / "cache") as cache:
+            assert cache.get(old_file) is None
+
+    def test_unusable_directory_disables_cache(
+        self, tmp_path: Path, old_file: Path
+    ) -> None:
+        """Test that an unusable cache location degrades to no caching."""
+        blocker = tmp_path / "not-a-dir"
+        blocker.touch()
+        with StatisticsCache(blocker) as cache:
+            assert cache.get(old_file) is None
+            cache.put(old_file, STATS)
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="XDG is not used on Windows")
+    def test_default_dir_honors_xdg(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that XDG_CACHE_HOME selects the cache location."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_cache_dir() == tmp_path / "office-wordcount"
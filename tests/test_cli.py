@@ -1,33 +1,94 @@
 """Integration tests for the CLI."""
 
+import contextlib
+import io
 import json
 import subprocess
 import sys
+from collections.abc import Callable
 from pathlib import Path
+from typing import NamedTuple
 
 import pytest
 
+from word_count import calculate_word_statistics
+from word_count.cli import (
+    _DEFAULT_OPTIONS,
+    create_parser,
+    get_single_value_field,
+    iter_file_chunks,
+    main,
+)
+
+
+class CliResult(NamedTuple):
+    """Outcome of one CLI invocation."""
+
+    returncode: int
+    stdout: str
+    stderr: str
+
+
+CliRunner = Callable[..., CliResult]
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the CLI's statistics cache out of the user's home directory."""
+    # default_cache_dir() reads LOCALAPPDATA on Windows, XDG_CACHE_HOME elsewhere
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
 
 @pytest.fixture
-def sample_file(tmp_path: Path) -> Path:
-    """Create a sample text file for testing."""
-    file = tmp_path / "sample.txt"
+def cli_runner(monkeypatch: pytest.MonkeyPatch) -> CliRunner:
+    """Run the CLI in-process, avoiding an interpreter start per test.
+
+    The returned callable takes the argument list and optional stdin text.
+    """
+
+    def run(args: list[str], stdin: str = "") -> CliResult:
+        monkeypatch.setattr(sys, "argv", ["office-wordcount", *args])
+        monkeypatch.setattr(sys, "stdin", io.StringIO(stdin))
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with (
+            contextlib.redirect_stdout(stdout),
+            contextlib.redirect_stderr(stderr),
+            pytest.raises(SystemExit) as exit_info,
+        ):
+            main()
+        # Same mapping as the interpreter: None is success, a message is failure
+        code = exit_info.value.code
+        returncode = code if isinstance(code, int) else int(code is not None)
+        return CliResult(returncode, stdout.getvalue(), stderr.getvalue())
+
+    return run
+
+
+@pytest.fixture(scope="session")
+def sample_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a sample text file for testing.
+
+    Session-scoped, like the other input files: tests only read them.
+    """
+    file = tmp_path_factory.mktemp("data") / "sample.txt"
     file.write_text("Hello World", encoding="utf-8")
     return file
 
 
-@pytest.fixture
-def japanese_file(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def japanese_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create a Japanese text file for testing."""
-    file = tmp_path / "japanese.txt"
+    file = tmp_path_factory.mktemp("data") / "japanese.txt"
     file.write_text("こんにちは世界", encoding="utf-8")
     return file
 
 
-@pytest.fixture
-def mixed_file(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def mixed_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create a mixed language text file for testing."""
-    file = tmp_path / "mixed.txt"
+    file = tmp_path_factory.mktemp("data") / "mixed.txt"
     file.write_text("Hello 世界", encoding="utf-8")
     return file
 
@@ -35,150 +96,131 @@ def mixed_file(tmp_path: Path) -> Path:
 class TestCliBasic:
     """Basic CLI functionality tests."""
 
-    def test_version(self) -> None:
+    def test_version(self, cli_runner: CliRunner) -> None:
         """Test --version flag."""
-        result = subprocess.run(
-            [sys.executable, "-m", "word_count.cli", "--version"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        result = cli_runner(["--version"])
         assert result.returncode == 0
         assert "office-wordcount" in result.stdout
 
-    def test_help(self) -> None:
-        """Test --help flag."""
+    def test_module_entry_point(self) -> None:
+        """Test a real ``python -m word_count.cli`` run, stdin to stdout."""
         result = subprocess.run(
-            [sys.executable, "-m", "word_count.cli", "--help"],
+            [sys.executable, "-m", "word_count.cli", "-w"],
+            input="Hello 世界".encode(),
             capture_output=True,
-            text=True,
             check=False,
         )
+        # Compared as bytes: nothing here needs decoding
+        assert result.returncode == 0
+        assert result.stdout.strip() == b"3"
+
+    def test_help(self, cli_runner: CliRunner) -> None:
+        """Test --help flag."""
+        result = cli_runner(["--help"])
         assert result.returncode == 0
         assert "usage:" in result.stdout.lower()
 
+    def test_default_options_match_parser(self) -> None:
+        """Test that the no-options fast path uses the parser's defaults."""
+        args = create_parser().parse_args([])
+        assert vars(args) == {"files": [], **_DEFAULT_OPTIONS}
+
 
 class TestCliFileInput:
     """Tests for file input processing."""
 
-    def test_single_file_json(self, sample_file: Path) -> None:
-        """Test processing a single file with JSON output."""
-        result = subprocess.run(
-            [
-                sys.executable,
-                "-m",
-                "word_count.cli",
-                "--format",
+    @pytest.mark.parametrize(
+        ("fmt", "check"),
+        [
+            (
                 "json",
-                str(sample_file),
-            ],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        assert result.returncode == 0
-        data = json.loads(result.stdout)
-        assert data["words"] == 2
-        assert data["non_asian_words"] == 2
-
-    def test_single_file_table(self, sample_file: Path) -> None:
-        """Test processing a single file with table output."""
-        result = subprocess.run(
-            [
-                sys.executable,
-                "-m",
-                "word_count.cli",
-                "--format",
-                "table",
-                str(sample_file),
-            ],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+                lambda out: (
+                    json.loads(out).items()
+                    >= {"words": 2, "non_asian_words": 2}.items()
+                ),
+            ),
+            ("table", lambda out: "Words" in out and "2" in out),
+        ],
+        ids=["json", "table"],
+    )
+    def test_single_file(
+        self,
+        cli_runner: CliRunner,
+        sample_file: Path,
+        fmt: str,
+        check: Callable[[str], bool],
+    ) -> None:
+        """Test processing a single file in each output format."""
+        result = cli_runner(["--format", fmt, str(sample_file)])
         assert result.returncode == 0
-        assert "Words" in result.stdout
-        assert "2" in result.stdout
+        assert check(result.stdout)
 
-    def test_japanese_file(self, japanese_file: Path) -> None:
+    def test_japanese_file(self, cli_runner: CliRunner, japanese_file: Path) -> None:
         """Test processing Japanese text file."""
-        result = subprocess.run(
-            [
-                sys.executable,
-                "-m",
-                "word_count.cli",
-                "--format",
-                "json",
-                str(japanese_file),
-            ],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        result = cli_runner(["--format", "json", str(japanese_file)])
         assert result.returncode == 0
         data = json.loads(result.stdout)
         assert data["asian_characters"] == 7
         assert data["non_asian_words"] == 0
 
-    def test_mixed_file(self, mixed_file: Path) -> None:
+    def test_mixed_file(self, cli_runner: CliRunner, mixed_file: Path) -> None:
         """Test processing mixed language file."""
-        result = subprocess.run(
-            [
-                sys.executable,
-                "-m",
-                "word_count.cli",
-                "--format",
-                "json",
-                str(mixed_file),
-            ],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        result = cli_runner(["--format", "json", str(mixed_file)])
         assert result.returncode == 0
         data = json.loads(result.stdout)
         assert data["words"] == 3  # 1 English + 2 Japanese
         assert data["non_asian_words"] == 1
         assert data["asian_characters"] == 2
 
-    def test_multiple_files(self, sample_file: Path, japanese_file: Path) -> None:
+    def test_multiple_files(
+        self, cli_runner: CliRunner, sample_file: Path, japanese_file: Path
+    ) -> None:
         """Test processing multiple files."""
-        result = subprocess.run(
-            [
-                sys.executable,
-                "-m",
-                "word_count.cli",
-                "--format",
-                "json",
-                str(sample_file),
-                str(japanese_file),
-            ],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        result = cli_runner(["--format", "json", str(sample_file), str(japanese_file)])
         assert result.returncode == 0
         data = json.loads(result.stdout)
         assert "files" in data
         assert len(data["files"]) == 2
         assert "total" in data
 
-    def test_total_only(self, sample_file: Path, japanese_file: Path) -> None:
+    def test_empty_file(self, cli_runner: CliRunner, tmp_path: Path) -> None:
+        """Test processing an empty file."""
+        empty = tmp_path / "empty.txt"
+        empty.touch()
+        result = cli_runner(["-C", str(empty)])
+        assert result.returncode == 0
+        assert result.stdout.strip() == "0"
+
+    def test_large_file(self, cli_runner: CliRunner, tmp_path: Path) -> None:
+        """Test that files processed in chunks match in-memory counting."""
+        text = "Hello 世界 wonderful\n" * 100_000
+        large = tmp_path / "large.txt"
+        large.write_text(text, encoding="utf-8")
+        result = cli_runner(["--format", "json", str(large)])
+        assert result.returncode == 0
+        assert json.loads(result.stdout) == calculate_word_statistics(text).to_dict()
+
+    def test_multiple_files_keep_order(
+        self,
+        cli_runner: CliRunner,
+        sample_file: Path,
+        japanese_file: Path,
+        mixed_file: Path,
+    ) -> None:
+        """Test that per-file results follow the command-line order."""
+        paths = [str(mixed_file), str(sample_file), str(japanese_file)]
+        result = cli_runner(["--format", "json", *paths])
+        assert result.returncode == 0
+        data = json.loads(result.stdout)
+        assert [f["file"] for f in data["files"]] == paths
+        assert data["total"]["words"] == 12
+
+    def test_total_only(
+        self, cli_runner: CliRunner, sample_file: Path, japanese_file: Path
+    ) -> None:
         """Test --total flag."""
-        result = subprocess.run(
-            [
-                sys.executable,
-                "-m",
-                "word_count.cli",
-                "--format",
-                "json",
-                "--total",
-                str(sample_file),
-                str(japanese_file),
-            ],
-            capture_output=True,
-            text=True,
-            check=False,
+        result = cli_runner(
+            ["--format", "json", "--total", str(sample_file), str(japanese_file)]
         )
         assert result.returncode == 0
         data = json.loads(result.stdout)
@@ -187,31 +229,59 @@ class TestCliFileInput:
         assert "files" not in data
 
 
+class TestIterFileChunks:
+    """Tests for chunked file reading."""
+
+    def test_multibyte_split_across_chunks(self, tmp_path: Path) -> None:
+        """Test that UTF-8 sequences split between chunks decode intact."""
+        file = tmp_path / "split.txt"
+        file.write_text("aこんにちは世界 b\r\n", encoding="utf-8")
+        chunks = list(iter_file_chunks(file, chunk_size=2))
+        assert len(chunks) > 1
+        assert "".join(chunks) == "aこんにちは世界 b\r\n"
+
+    def test_truncated_sequence(self, tmp_path: Path) -> None:
+        """Test that a file ending mid-sequence is reported as invalid."""
+        file = tmp_path / "truncated.txt"
+        file.write_bytes("世界".encode()[:-1])
+        with pytest.raises(UnicodeDecodeError):
+            list(iter_file_chunks(file, chunk_size=4))
+
+
+class TestCliCache:
+    """Tests for the persistent statistics cache."""
+
+    def test_cache_created(
+        self, cli_runner: CliRunner, sample_file: Path, cache_home: Path
+    ) -> None:
+        """Test that processing files opens the cache by default."""
+        result = cli_runner(["-w", str(sample_file)])
+        assert result.returncode == 0
+        assert result.stdout.strip() == "2"
+        assert (cache_home / "office-wordcount").is_dir()
+
+    def test_no_cache(
+        self, cli_runner: CliRunner, sample_file: Path, cache_home: Path
+    ) -> None:
+        """Test that --no-cache leaves no cache behind."""
+        result = cli_runner(["--no-cache", str(sample_file)])
+        assert result.returncode == 0
+        assert not cache_home.exists()
+
+
 class TestCliStdin:
     """Tests for stdin processing."""
 
-    def test_stdin_json(self) -> None:
+    def test_stdin_json(self, cli_runner: CliRunner) -> None:
         """Test reading from stdin with JSON output."""
-        result = subprocess.run(
-            [sys.executable, "-m", "word_count.cli", "--format", "json"],
-            input="Hello World",
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        result = cli_runner(["--format", "json"], stdin="Hello World")
         assert result.returncode == 0
         data = json.loads(result.stdout)
         assert data["words"] == 2
 
-    def test_stdin_mixed_text(self) -> None:
+    def test_stdin_mixed_text(self, cli_runner: CliRunner) -> None:
         """Test stdin with mixed Asian/non-Asian text."""
-        result = subprocess.run(
-            [sys.executable, "-m", "word_count.cli", "--format", "json"],
-            input="Hello 世界",
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        result = cli_runner(["--format", "json"], stdin="Hello 世界")
         assert result.returncode == 0
         data = json.loads(result.stdout)
         assert data["words"] == 3  # 1 English + 2 Japanese
@@ -220,115 +290,102 @@ class TestCliStdin:
 class TestCliSingleValue:
     """Tests for single-value output options."""
 
-    def test_words_option(self, mixed_file: Path) -> None:
-        """Test -w/--words option."""
-        result = subprocess.run(
-            [sys.executable, "-m", "word_count.cli", "-w", str(mixed_file)],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        assert result.returncode == 0
-        assert result.stdout.strip() == "3"
-
-    def test_chars_option(self, mixed_file: Path) -> None:
-        """Test -c/--chars option."""
-        result = subprocess.run(
-            [sys.executable, "-m", "word_count.cli", "-c", str(mixed_file)],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        assert result.returncode == 0
-        assert result.stdout.strip() == "7"
-
-    def test_chars_with_space_option(self, mixed_file: Path) -> None:
-        """Test -C/--chars-with-space option."""
-        result = subprocess.run(
-            [sys.executable, "-m", "word_count.cli", "-C", str(mixed_file)],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        assert result.returncode == 0
-        assert result.stdout.strip() == "8"
-
-    def test_asian_option(self, mixed_file: Path) -> None:
-        """Test -a/--asian option."""
-        result = subprocess.run(
-            [sys.executable, "-m", "word_count.cli", "-a", str(mixed_file)],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+    def test_mixed_file_all_counts(
+        self, cli_runner: CliRunner, mixed_file: Path
+    ) -> None:
+        """Test every count of the mixed file in one invocation."""
+        result = cli_runner(["--format", "json", str(mixed_file)])
         assert result.returncode == 0
-        assert result.stdout.strip() == "2"
-
-    def test_non_asian_option(self, mixed_file: Path) -> None:
-        """Test -A/--non-asian option."""
-        result = subprocess.run(
-            [sys.executable, "-m", "word_count.cli", "-A", str(mixed_file)],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        assert json.loads(result.stdout) == {
+            "words": 3,
+            "characters_no_space": 7,
+            "characters_with_space": 8,
+            "non_asian_words": 1,
+            "asian_characters": 2,
+        }
+
+    @pytest.mark.parametrize(
+        ("flag", "expected"),
+        [("-w", "3"), ("-c", "7"), ("-C", "8"), ("-a", "2"), ("-A", "1")],
+    )
+    def test_option(
+        self, cli_runner: CliRunner, mixed_file: Path, flag: str, expected: str
+    ) -> None:
+        """Test that each single-value option prints just its count."""
+        result = cli_runner([flag, str(mixed_file)])
         assert result.returncode == 0
-        assert result.stdout.strip() == "1"
-
-    def test_stdin_with_words_option(self) -> None:
+        assert result.stdout.strip() == expected
+
+    @pytest.mark.parametrize(
+        ("flags", "field"),
+        [
+            (["-w", "--words"], "words"),
+            (["-c", "--chars"], "characters_no_space"),
+            (["-C", "--chars-with-space"], "characters_with_space"),
+            (["-a", "--asian"], "asian_characters"),
+            (["-A", "--non-asian"], "non_asian_words"),
+        ],
+    )
+    def test_option_selects_field(self, flags: list[str], field: str) -> None:
+        """Test that short and long option forms select the same field."""
+        parser = create_parser()
+        for flag in flags:
+            assert get_single_value_field(parser.parse_args([flag])) == field
+
+    def test_stdin_with_words_option(self, cli_runner: CliRunner) -> None:
         """Test -w option with stdin."""
-        result = subprocess.run(
-            [sys.executable, "-m", "word_count.cli", "-w"],
-            input="Hello 世界",
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        result = cli_runner(["-w"], stdin="Hello 世界")
         assert result.returncode == 0
         assert result.stdout.strip() == "3"
 
     def test_multiple_files_with_words_option(
-        self, sample_file: Path, japanese_file: Path
+        self, cli_runner: CliRunner, sample_file: Path, japanese_file: Path
     ) -> None:
         """Test -w option with multiple files (returns total)."""
-        result = subprocess.run(
-            [
-                sys.executable,
-                "-m",
-                "word_count.cli",
-                "-w",
-                str(sample_file),
-                str(japanese_file),
-            ],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        result = cli_runner(["-w", str(sample_file), str(japanese_file)])
         assert result.returncode == 0
         assert result.stdout.strip() == "9"  # 2 (Hello World) + 7 (Japanese)
 
+    def test_large_file_with_asian_option(
+        self, cli_runner: CliRunner, tmp_path: Path
+    ) -> None:
+        """Test a single-value option on a file processed in chunks."""
+        text = "Hello 世界 wonderful\n" * 100_000
+        large = tmp_path / "large.txt"
+        large.write_text(text, encoding="utf-8")
+        result = cli_runner(["-a", str(large)])
+        assert result.returncode == 0
+        assert result.stdout.strip() == "200000"
+
 
 class TestCliErrors:
     """Tests for error handling."""
 
-    def test_file_not_found(self) -> None:
+    def test_file_not_found(self, cli_runner: CliRunner) -> None:
         """Test error message for missing file."""
-        result = subprocess.run(
-            [sys.executable, "-m", "word_count.cli", "nonexistent.txt"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        result = cli_runner(["nonexistent.txt"])
         assert result.returncode == 1
         assert "not found" in result.stderr.lower()
 
-    def test_is_a_directory(self, tmp_path: Path) -> None:
+    def test_missing_file_among_many(
+        self, cli_runner: CliRunner, sample_file: Path
+    ) -> None:
+        """Test that a missing file fails a multi-file run."""
+        result = cli_runner([str(sample_file), "nonexistent.txt", str(sample_file)])
+        assert result.returncode == 1
+        assert "nonexistent.txt" in result.stderr
+        assert result.stdout == ""
+
+    def test_invalid_utf8(self, cli_runner: CliRunner, tmp_path: Path) -> None:
+        """Test error message for a file that is not UTF-8."""
+        binary = tmp_path / "binary.txt"
+        binary.write_bytes(b"Hello \xff World")
+        result = cli_runner([str(binary)])
+        assert result.returncode == 1
+        assert "not valid utf-8" in result.stderr.lower()
+
+    def test_is_a_directory(self, cli_runner: CliRunner, tmp_path: Path) -> None:
         """Test error message when given a directory."""
-        result = subprocess.run(
-            [sys.executable, "-m", "word_count.cli", str(tmp_path)],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+        result = cli_runner([str(tmp_path)])
         assert result.returncode == 1
         assert "is a directory" in result.stderr.lower()
@@ -1,15 +1,36 @@
 """Tests for the word counting functionality."""
 
+import operator
+from collections.abc import Callable
+from dataclasses import fields
+
 import pytest
 
 from word_count import (
     calculate_word_statistics,
+    calculate_word_statistics_streaming,
+    count_asian_characters,
     count_characters,
     count_characters_with_space,
+    count_non_asian_words,
     count_words,
 )
 from word_count.statistics import Statistics
 
+# Inputs shared by several tests; each is analyzed once per module
+_INPUTS = {
+    "hello_world": "Hello World",
+    "konnichiwa": "こんにちは",
+    "hello_sekai": "Hello 世界",
+    "empty": "",
+}
+
+
+@pytest.fixture(scope="module")
+def stats_cache() -> dict[str, Statistics]:
+    """Statistics of each of ``_INPUTS``, keyed like it."""
+    return {key: calculate_word_statistics(text) for key, text in _INPUTS.items()}
+
 
 class TestCalculateWordStatistics:
     """Test cases for calculate_word_statistics function."""
@@ -33,9 +54,9 @@ class TestCalculateWordStatistics:
         assert result.asian_characters == 8
         assert result.non_asian_words == 0
 
-    def test_mixed_english_japanese(self) -> None:
+    def test_mixed_english_japanese(self, stats_cache: dict[str, Statistics]) -> None:
         """Test counting mixed English and Japanese text."""
-        result = calculate_word_statistics("Hello 世界")
+        result = stats_cache["hello_sekai"]
         assert result.words == 3  # 1 English word + 2 Japanese chars
         assert result.non_asian_words == 1
         assert result.asian_characters == 2
@@ -63,9 +84,9 @@ class TestCalculateWordStatistics:
             asian_characters=0,
         )
 
-    def test_empty_string(self) -> None:
+    def test_empty_string(self, stats_cache: dict[str, Statistics]) -> None:
         """Test empty input."""
-        result = calculate_word_statistics("")
+        result = stats_cache["empty"]
         assert result == Statistics(
             words=0,
             characters_no_space=0,
@@ -87,6 +108,17 @@ class TestCalculateWordStatistics:
         assert result.words == 4
         assert result.asian_characters == 4
 
+    def test_ascii_control_separators(self) -> None:
+        """Test that U+001C..U+001F do not split words in ASCII text."""
+        result = calculate_word_statistics("foo\x1cbar \x1f")
+        assert result == Statistics(
+            words=2,
+            characters_no_space=8,
+            characters_with_space=9,
+            non_asian_words=2,
+            asian_characters=0,
+        )
+
     def test_numbers_and_punctuation(self) -> None:
         """Test that numbers and punctuation are handled correctly."""
         result = calculate_word_statistics("Test 123, example.")
@@ -94,6 +126,34 @@ class TestCalculateWordStatistics:
         assert result.asian_characters == 0
 
 
+class TestCalculateWordStatisticsStreaming:
+    """Tests for calculate_word_statistics_streaming function."""
+
+    @pytest.mark.parametrize(
+        "chunks",
+        [
+            ["Hello World"],
+            ["Hel", "lo Wor", "ld"],
+            ["Hello ", "World"],
+            ["Hello", " World"],
+            ["Hello", "", "World"],
+            ["Hello世", "界World"],
+            ["foo\u200b", "bar\r", "\n baz"],
+            [],
+        ],
+    )
+    def test_matches_joined_text(self, chunks: list[str]) -> None:
+        """Test that chunked input counts the same as the joined text."""
+        expected = calculate_word_statistics("".join(chunks))
+        assert calculate_word_statistics_streaming(chunks) == expected
+
+    def test_word_spanning_chunks(self) -> None:
+        """Test that a word split across chunks is counted once."""
+        result = calculate_word_statistics_streaming(["Hel", "lo"])
+        assert result.words == 1
+        assert result.non_asian_words == 1
+
+
 class TestStatisticsDataclass:
     """Tests for the Statistics dataclass."""
 
@@ -127,112 +187,121 @@ class TestStatisticsDataclass:
             "asian_characters": 5,
         }
 
-    def test_addition(self) -> None:
-        """Test Statistics addition for aggregation."""
-        stats1 = Statistics(
-            words=10,
-            characters_no_space=50,
-            characters_with_space=55,
-            non_asian_words=5,
-            asian_characters=5,
-        )
-        stats2 = Statistics(
-            words=20,
-            characters_no_space=100,
-            characters_with_space=110,
-            non_asian_words=10,
-            asian_characters=10,
-        )
-        total = stats1 + stats2
-        assert total.words == 30
-        assert total.characters_no_space == 150
-        assert total.characters_with_space == 165
-        assert total.non_asian_words == 15
-        assert total.asian_characters == 15
-
-    def test_equality(self) -> None:
-        """Test Statistics equality comparison."""
-        stats1 = Statistics(
-            words=10,
-            characters_no_space=50,
-            characters_with_space=55,
-            non_asian_words=5,
-            asian_characters=5,
-        )
-        stats2 = Statistics(
-            words=10,
-            characters_no_space=50,
-            characters_with_space=55,
-            non_asian_words=5,
-            asian_characters=5,
-        )
-        assert stats1 == stats2
-
-    def test_inequality(self) -> None:
-        """Test Statistics inequality comparison."""
-        stats1 = Statistics(
-            words=10,
-            characters_no_space=50,
-            characters_with_space=55,
-            non_asian_words=5,
-            asian_characters=5,
-        )
-        stats2 = Statistics(
-            words=20,
-            characters_no_space=50,
-            characters_with_space=55,
-            non_asian_words=5,
-            asian_characters=5,
-        )
-        assert stats1 != stats2
+    def test_to_dict_covers_all_fields(self) -> None:
+        """Test that to_dict stays in sync with the dataclass fields."""
+        stats = Statistics(1, 2, 3, 4, 5)
+        assert list(stats.to_dict()) == [f.name for f in fields(Statistics)]
+        assert list(stats.to_dict().values()) == [1, 2, 3, 4, 5]
+
+    @pytest.mark.parametrize(
+        ("a", "b", "op", "expected"),
+        [
+            (
+                Statistics(10, 50, 55, 5, 5),
+                Statistics(20, 100, 110, 10, 10),
+                operator.add,
+                Statistics(30, 150, 165, 15, 15),
+            ),
+            (
+                Statistics(10, 50, 55, 5, 5),
+                Statistics(10, 50, 55, 5, 5),
+                operator.eq,
+                True,
+            ),
+            (
+                Statistics(10, 50, 55, 5, 5),
+                Statistics(20, 50, 55, 5, 5),
+                operator.ne,
+                True,
+            ),
+            (
+                Statistics(10, 50, 55, 5, 5),
+                Statistics(10, 50, 55, 5, 6),
+                operator.eq,
+                False,
+            ),
+        ],
+        ids=["addition", "equality", "inequality", "last-field-differs"],
+    )
+    def test_statistics_algebra(
+        self,
+        a: Statistics,
+        b: Statistics,
+        op: Callable[[Statistics, Statistics], object],
+        expected: object,
+    ) -> None:
+        """Test Statistics addition and (in)equality comparison."""
+        assert op(a, b) == expected
+
+    def test_total(self) -> None:
+        """Test that Statistics.total matches chained addition."""
+        items = [Statistics(1, 2, 3, 4, 5), Statistics(10, 20, 30, 40, 50)] * 3
+        expected = items[0]
+        for stats in items[1:]:
+            expected = expected + stats
+        assert Statistics.total(items) == expected
+        assert Statistics.total(iter(items)) == expected
+
+    def test_total_empty(self) -> None:
+        """Test that the total of no Statistics is all zeros."""
+        assert Statistics.total([]) == Statistics(0, 0, 0, 0, 0)
 
 
 class TestCountWords:
     """Tests for count_words function."""
 
-    def test_english(self) -> None:
+    def test_english(self, stats_cache: dict[str, Statistics]) -> None:
         """Test counting English words."""
-        assert count_words("Hello World") == 2
+        assert stats_cache["hello_world"].words == 2
 
-    def test_japanese(self) -> None:
+    def test_japanese(self, stats_cache: dict[str, Statistics]) -> None:
         """Test counting Japanese text (each char = 1 word)."""
-        assert count_words("こんにちは") == 5
+        assert stats_cache["konnichiwa"].words == 5
 
-    def test_mixed(self) -> None:
+    def test_mixed(self, stats_cache: dict[str, Statistics]) -> None:
         """Test counting mixed English and Japanese."""
-        assert count_words("Hello 世界") == 3  # 1 + 2
+        assert stats_cache["hello_sekai"].words == 3  # 1 + 2
+
+    def test_ascii_whitespace(self) -> None:
+        """Test ASCII text separated by mixed whitespace."""
+        assert count_words(" one\ttwo\r\nthree\vfour\ffive ") == 5
 
-    def test_empty(self) -> None:
+    @pytest.mark.parametrize("prefix", ["", " ", "\n\t"])
+    def test_long_ascii_text(self, prefix: str) -> None:
+        """Test long ASCII text, which is counted without splitting."""
+        assert count_words(prefix + "one\ttwo\r\nthree\x1cfour " * 100) == 300
+
+    def test_empty(self, stats_cache: dict[str, Statistics]) -> None:
         """Test empty string."""
-        assert count_words("") == 0
+        assert stats_cache["empty"].words == 0
 
 
 class TestCountCharacters:
     """Tests for count_characters function."""
 
-    def test_english(self) -> None:
+    def test_english(self, stats_cache: dict[str, Statistics]) -> None:
         """Test counting English characters (no spaces)."""
-        assert count_characters("Hello World") == 10
+        assert stats_cache["hello_world"].characters_no_space == 10
 
-    def test_japanese(self) -> None:
+    def test_japanese(self, stats_cache: dict[str, Statistics]) -> None:
         """Test counting Japanese characters."""
-        assert count_characters("こんにちは") == 5
+        assert stats_cache["konnichiwa"].characters_no_space == 5
 
     def test_with_spaces(self) -> None:
         """Test that spaces are excluded."""
         assert count_characters("a b c") == 3
 
-    def test_empty(self) -> None:
+    def test_empty(self, stats_cache: dict[str, Statistics]) -> None:
         """Test empty string."""
-        assert count_characters("") == 0
+        assert stats_cache["empty"].characters_no_space == 0
 
 
 class TestCountCharactersWithSpace:
     """Tests for count_characters_with_space function."""
 
-    def test_english(self) -> None:
+    def test_english(self, stats_cache: dict[str, Statistics]) -> None:
         """Test counting English characters with spaces."""
-        assert count_characters_with_space("Hello World") == 11
+        assert stats_cache["hello_world"].characters_with_space == 11
 
     def test_with_newlines(self) -> None:
         """Test that newlines are excluded."""
@@ -242,6 +311,55 @@ class TestCountCharactersWithSpace:
         """Test that tabs are included."""
         assert count_characters_with_space("a\tb") == 3
 
-    def test_empty(self) -> None:
+    def test_empty(self, stats_cache: dict[str, Statistics]) -> None:
         """Test empty string."""
-        assert count_characters_with_space("") == 0
+        assert stats_cache["empty"].characters_with_space == 0
+
+
+class TestCountAsianCharacters:
+    """Tests for count_asian_characters function."""
+
+    def test_mixed(self) -> None:
+        """Test counting Asian characters in mixed text."""
+        assert count_asian_characters("Hello 世界 こんにちは") == 7
+
+    def test_english(self) -> None:
+        """Test that ASCII text has no Asian characters."""
+        assert count_asian_characters("Hello World") == 0
+
+
+class TestCountNonAsianWords:
+    """Tests for count_non_asian_words function."""
+
+    def test_mixed(self) -> None:
+        """Test that words are split at Asian characters."""
+        assert count_non_asian_words("Hello世界World test") == 3
+
+    def test_english(self) -> None:
+        """Test counting ASCII words."""
+        assert count_non_asian_words("Hello  World\x1c") == 2
+
+
+class TestCountersMatchStatistics:
+    """Tests that each single-value counter agrees with the full statistics."""
+
+    @pytest.mark.parametrize("key", list(_INPUTS))
+    @pytest.mark.parametrize(
+        ("counter", "field"),
+        [
+            (count_words, "words"),
+            (count_characters, "characters_no_space"),
+            (count_characters_with_space, "characters_with_space"),
+            (count_non_asian_words, "non_asian_words"),
+            (count_asian_characters, "asian_characters"),
+        ],
+    )
+    def test_matches(
+        self,
+        stats_cache: dict[str, Statistics],
+        key: str,
+        counter: Callable[[str], int],
+        field: str,
+    ) -> None:
+        """Test a counter against the cached Statistics of the same input."""
+        assert counter(_INPUTS[key]) == getattr(stats_cache[key], field)
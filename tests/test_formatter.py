@@ -1,16 +1,21 @@
 """Tests for output formatters."""
 
+import io
 import json
 
 import pytest
 
-from word_count.formatter import format_json, format_table
+from word_count import formatter
+from word_count.formatter import format_json, format_table, write_json, write_table
 from word_count.statistics import Statistics
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_stats() -> Statistics:
-    """Create sample Statistics for testing."""
+    """Create sample Statistics for testing.
+
+    Session-scoped: Statistics is immutable, so tests can safely share it.
+    """
     return Statistics(
         words=100,
         characters_no_space=500,
@@ -43,6 +48,29 @@ class TestFormatJson:
         result = format_json(sample_stats, indent=None)
         assert "\n" not in result
 
+    @pytest.mark.parametrize("indent", [2, None, 4])
+    @pytest.mark.parametrize("name", ["file1.txt", "日本.txt", "del\x7f.txt"])
+    def test_same_output_without_orjson(
+        self,
+        sample_stats: Statistics,
+        monkeypatch: pytest.MonkeyPatch,
+        indent: int | None,
+        name: str,
+    ) -> None:
+        """Test that the stdlib fallback produces identical output."""
+        files = [(name, sample_stats)]
+        expected = format_json(files, total=sample_stats, indent=indent)
+        # Non-ASCII characters and DEL are escaped either way
+        assert expected.isascii()
+        assert "\x7f" not in expected
+        monkeypatch.setattr(formatter, "orjson", None)
+        assert format_json(files, total=sample_stats, indent=indent) == expected
+
+    def test_undecodable_filename(self, sample_stats: Statistics) -> None:
+        """Test filenames containing lone surrogates (non-UTF-8 on disk)."""
+        result = format_json([("bad\udcff.txt", sample_stats)])
+        assert json.loads(result)["files"][0]["file"] == "bad\udcff.txt"
+
     def test_multiple_files_without_total(self, sample_stats: Statistics) -> None:
         """Test JSON output for multiple files without total."""
         files = [("file1.txt", sample_stats), ("file2.txt", sample_stats)]
@@ -51,6 +79,20 @@ class TestFormatJson:
         assert len(data["files"]) == 2
         assert "total" not in data
 
+    @pytest.mark.parametrize("indent", [2, None, 4])
+    @pytest.mark.parametrize("with_total", [True, False])
+    def test_write_json_matches_format_json(
+        self, sample_stats: Statistics, indent: int | None, with_total: bool
+    ) -> None:
+        """Test that write_json emits format_json's text plus a newline."""
+        total = sample_stats if with_total else None
+        files = [("file1.txt", sample_stats), ('odd "name"\n.txt', sample_stats)]
+        for stats in (sample_stats, files, []):
+            stream = io.StringIO()
+            write_json(stats, stream, total=total, indent=indent)
+            expected = format_json(stats, total=total, indent=indent) + "\n"
+            assert stream.getvalue() == expected
+
 
 class TestFormatTable:
     """Tests for table formatting."""
@@ -86,3 +128,12 @@ class TestFormatTable:
         """Test that single stats uses vertical format with colon separator."""
         result = format_table(sample_stats)
         assert " : " in result  # Vertical format uses colon separator
+
+    def test_write_table_matches_format_table(self, sample_stats: Statistics) -> None:
+        """Test that write_table emits format_table's text plus a newline."""
+        files = [("file1.txt", sample_stats), ("a-much-longer-name.txt", sample_stats)]
+        for stats in (sample_stats, files):
+            stream = io.StringIO()
+            write_table(stats, stream, total=sample_stats)
+            expected = format_table(stats, total=sample_stats) + "\n"
+            assert stream.getvalue() == expected